@@ -1,26 +1,55 @@
 #!/usr/bin/env python3
 """
 Aplikasi CLI Manajemen Keuangan Sederhana
-- Bahasa: Python (standar library saja)
-- Fitur: tambah pemasukan, tambah pengeluaran, lihat saldo, lihat riwayat transaksi
-- Penyimpanan: file JSON (`data.json`)
+- Bahasa: Python (standar library saja; `orjson` dipakai otomatis jika terpasang)
+- Fitur: tambah pemasukan, tambah pengeluaran, lihat saldo, lihat riwayat transaksi, ringkasan
+- Penyimpanan: file JSON Lines (`data.jsonl`) untuk riwayat dan `saldo.json` untuk saldo
+- Uang disimpan sebagai bilangan bulat dalam sen (1 rupiah = 100 sen) agar hitungan selalu tepat
+- Semua fungsi diberi anotasi tipe, jadi bisa (opsional) dikompilasi dengan `mypyc main.py`
 
 Nama fungsi penting (bahasa Indonesia):
 - tambah_pemasukan()
 - tambah_pengeluaran()
 - lihat_saldo()
 - lihat_riwayat()
+- lihat_ringkasan()
 
 Kodenya ditulis sederhana dan diberi komentar singkat agar mudah dipahami pemula.
 """
 
+import atexit
+import functools
 import json
+import mmap
 import os
-from datetime import datetime
+import signal
+from array import array
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
 import sys
+import time
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# orjson jauh lebih cepat untuk serialisasi JSON; jika tidak ada, pakai json bawaan
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # ----- Konstanta file -----
-DATA_FILE = os.path.join(os.path.dirname(__file__), "data.json")
+BASE_DIR = os.path.dirname(__file__)
+RIWAYAT_FILE = os.path.join(BASE_DIR, "data.jsonl")  # satu transaksi per baris
+SALDO_FILE = os.path.join(BASE_DIR, "saldo.json")
+DATA_FILE = os.path.join(BASE_DIR, "data.json")  # format lama, hanya dibaca untuk migrasi
+
+# File riwayat dibuka sekali (mode append) lalu dipakai ulang
+_riwayat_file: Optional[BinaryIO] = None
+
+# Transaksi baru ditampung di memori dan baru ditulis saat flush_data().
+# Menu memanggil flush_data() setelah setiap transaksi; batas ini untuk pemanggilan beruntun.
+FLUSH_SETIAP = 50  # tulis otomatis setiap sekian transaksi (jaga-jaga jika crash)
+DIRTY = False
+_antrian: List[bytes] = []
 
 # ----- Warna (ANSI escape codes) -----
 RESET = "\033[0m"
@@ -32,91 +61,393 @@ FG_RED = "\033[31m"
 FG_MAGENTA = "\033[35m"
 FG_BLUE = "\033[34m"
 
+# ----- Lebar kolom tabel (dipakai bersama oleh laporan saldo dan riwayat) -----
+LEBAR_TANGGAL = 19
+LEBAR_JENIS = 12
+LEBAR_JUMLAH = 18
+LEBAR_KETERANGAN = 29
+
+# ----- Struktur data riwayat -----
+
+# Kode jenis transaksi di kolom `jenis` (0 = pemasukan, 1 = pengeluaran)
+PEMASUKAN = 0
+PENGELUARAN = 1
+NAMA_JENIS = ("Pemasukan", "Pengeluaran")
+
+# Satu transaksi dalam bentuk dict, seperti satu baris di `data.jsonl`
+Transaksi = Dict[str, Any]
+
+
+@dataclass
+class Riwayat:
+    """Riwayat transaksi disimpan per kolom (bukan list of dict) agar hemat memori.
+
+    Baris ke-i terdiri dari `tanggal[i]`, `jenis[i]`, `jumlah[i]` (dalam sen), dan `keterangan[i]`.
+    """
+    tanggal: List[str] = field(default_factory=list)
+    jenis: "array[int]" = field(default_factory=lambda: array("b"))
+    jumlah: "array[int]" = field(default_factory=lambda: array("q"))
+    keterangan: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.jumlah)
+
+    def append(self, transaksi: Transaksi) -> None:
+        """Menambahkan satu transaksi (dict seperti di file) ke setiap kolom."""
+        # Hitung semua nilai dulu; kalau ada yang gagal, tidak ada kolom yang berubah
+        tanggal = transaksi.get("tanggal", "-")
+        jenis = PEMASUKAN if transaksi.get("jenis", "-").lower().startswith("pemasukan") else PENGELUARAN
+        if "jumlah_sen" in transaksi:
+            jumlah = int(transaksi["jumlah_sen"])
+            if not -MAKS_SEN <= jumlah <= MAKS_SEN:
+                raise OverflowError("jumlah terlalu besar")
+        else:
+            # Format lama: `jumlah` dalam rupiah (float)
+            jumlah = ke_sen(transaksi.get("jumlah", 0))
+        keterangan = transaksi.get("keterangan", "-")
+
+        self.tanggal.append(tanggal)
+        self.jenis.append(jenis)
+        self.jumlah.append(jumlah)
+        self.keterangan.append(keterangan)
+
+    @classmethod
+    def dari_dicts(cls, items: Iterable[Transaksi]) -> "Riwayat":
+        """Membuat Riwayat dari list of dict (format file)."""
+        riwayat = cls()
+        for transaksi in items:
+            riwayat.append(transaksi)
+        return riwayat
+
+    def ke_dicts(self) -> Iterator[Transaksi]:
+        """Menghasilkan setiap transaksi sebagai dict (format file)."""
+        for tanggal, jenis, jumlah, ket in zip(self.tanggal, self.jenis, self.jumlah, self.keterangan):
+            yield {"tanggal": tanggal, "jenis": NAMA_JENIS[jenis], "jumlah_sen": jumlah, "keterangan": ket}
+
+
+@dataclass
+class State:
+    """Seluruh data aplikasi yang sedang dipakai: saldo dan riwayat transaksi."""
+    saldo: int = 0  # dalam sen
+    riwayat: Riwayat = field(default_factory=Riwayat)
+
+
 # ----- Utility sederhana -----
 
-def format_rupiah(n):
-    """Format angka menjadi string rupiah dengan pemisah ribuan."""
-    try:
-        n = float(n)
-    except Exception:
-        return str(n)
-    # Jika bilangan bulat tampil tanpa desimal
-    if n.is_integer():
-        return f"Rp {int(n):,}".replace(",", ".")
-    return f"Rp {n:,.2f}".replace(",", "~").replace(".", ",").replace("~", ".")
+# Tabel penukaran karakter: pemisah ribuan "," -> "."
+_TR = str.maketrans({",": "."})
+
+
+# Batas jumlah/saldo dalam sen: harus muat di int64 (kolom `array("q")` dan orjson)
+MAKS_SEN = 2**63 - 1
 
 
-def clear_screen():
-    """Membersihkan terminal (portabel sederhana)."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+def ke_sen(rupiah: Any) -> int:
+    """Mengubah jumlah rupiah (angka/float dari file lama) menjadi bilangan bulat sen.
+
+    OverflowError jika hasilnya tidak muat di int64.
+    """
+    sen = int(round(float(rupiah) * 100))
+    if not -MAKS_SEN <= sen <= MAKS_SEN:
+        raise OverflowError("jumlah terlalu besar")
+    return sen
+
+
+def teks_ke_sen(teks: str) -> int:
+    """Mengubah input pengguna (misal "1234.56") menjadi sen secara tepat lewat Decimal, tanpa float.
+
+    ValueError jika bukan angka, OverflowError jika hasilnya tidak muat di int64.
+    """
+    try:
+        rupiah = Decimal(teks)
+    except InvalidOperation:
+        raise ValueError(f"bukan angka: {teks!r}") from None
+    if not rupiah.is_finite():
+        raise ValueError(f"bukan angka: {teks!r}")
+    if rupiah.adjusted() > 18:
+        # Lebih dari 19 digit rupiah pasti melewati batas; cek dulu agar Decimal tidak overflow
+        raise OverflowError("jumlah terlalu besar")
+    # Pembulatan ke sen terdekat (half-even, sama seperti round() sebelumnya)
+    sen = rupiah.scaleb(2).to_integral_value()
+    if not -MAKS_SEN <= sen <= MAKS_SEN:
+        raise OverflowError("jumlah terlalu besar")
+    return int(sen)
+
+
+# Cache tanpa batas: jumlah yang berbeda paling banyak sebanyak isi riwayat, dan
+# cache LRU terbatas akan selalu meleset saat tabel riwayat yang panjang digambar ulang
+@functools.lru_cache(maxsize=None)
+def format_rupiah(sen: int) -> str:
+    """Format jumlah dalam sen menjadi string rupiah dengan pemisah ribuan."""
+    tanda = "-" if sen < 0 else ""
+    rupiah, sisa = divmod(abs(sen), 100)
+    teks = "Rp " + tanda + format(rupiah, ",").translate(_TR)
+    # Jika tidak ada pecahan sen tampil tanpa desimal
+    if sisa:
+        teks += f",{sisa:02d}"
+    return teks
+
+
+# Cache timestamp: diformat ulang hanya jika detiknya sudah berganti
+_last_ts_sec: int = 0
+_last_ts_str: str = ""
+
+
+def now_str() -> str:
+    """Waktu sekarang dalam format `YYYY-MM-DD HH:MM:SS`."""
+    global _last_ts_sec, _last_ts_str
+    detik = int(time.time())
+    if detik != _last_ts_sec:
+        _last_ts_sec = detik
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(detik))
+    return _last_ts_str
+
+
+def clear_screen() -> None:
+    """Membersihkan terminal dengan kode ANSI (tanpa menjalankan proses `clear`/`cls`)."""
+    # cmd.exe lama di Windows tidak mengenal kode ANSI, jadi tetap pakai `cls`
+    if os.name == 'nt' and not (os.environ.get("WT_SESSION") or os.environ.get("TERM")):
+        os.system('cls')
+        return
+    sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+    sys.stdout.flush()
 
 
 # ----- Penyimpanan data -----
 
-def load_data():
-    """Membaca data dari `data.json`. Jika tidak ada, buat data awal."""
+# Encoder json bawaan dibuat sekali dengan format ringkas (tanpa spasi), sama seperti orjson
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialisasi ke JSON ringkas dalam bentuk bytes UTF-8."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_encoder.encode(obj).encode("utf-8")
+
+
+def _loads(blob: bytes) -> Any:
+    """Membaca JSON dari bytes."""
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def _data_awal() -> State:
+    """Data kosong untuk pengguna baru."""
+    return State()
+
+
+def _load_data_lama() -> Optional[State]:
+    """Membaca `data.json` format lama (jika ada) agar bisa dipindahkan ke format baru."""
     if not os.path.exists(DATA_FILE):
-        data_awal = {"saldo": 0, "riwayat": []}
+        return None
+    try:
+        with open(DATA_FILE, "rb") as f:
+            data = _loads(f.read())
+        return State(ke_sen(data.get("saldo", 0)), Riwayat.dari_dicts(data.get("riwayat", [])))
+    except Exception:
+        return None
+
+
+def _baca_riwayat() -> Riwayat:
+    """Membaca `data.jsonl` menjadi Riwayat.
+
+    Baris terakhir yang terpotong (program mati saat menulis) dibuang dan file dipangkas,
+    agar transaksi berikutnya tidak tersambung ke baris yang rusak.
+    Baris rusak di tengah file tetap dianggap file korup (exception diteruskan).
+    """
+    riwayat = Riwayat()
+    akhir_valid = None  # posisi byte tempat file harus dipangkas, jika ada baris terpotong
+    tanpa_newline = False
+    with open(RIWAYAT_FILE, "r+b") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return riwayat  # mmap tidak bisa memetakan file kosong
+        # Petakan file ke memori (mmap) lalu baca per baris, tanpa menyalin seluruh isi file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ukuran = len(mm)
+            for baris in iter(mm.readline, b""):
+                if not baris.strip():
+                    continue
+                try:
+                    transaksi = _loads(baris)
+                except ValueError:
+                    if mm.tell() < ukuran:
+                        raise
+                    akhir_valid = ukuran - len(baris)
+                    break
+                riwayat.append(transaksi)
+            tanpa_newline = akhir_valid is None and mm[ukuran - 1:] != b"\n"
+        if akhir_valid is not None:
+            f.truncate(akhir_valid)
+        elif tanpa_newline:
+            # Baris terakhir lengkap tapi belum diakhiri newline
+            f.seek(0, os.SEEK_END)
+            f.write(b"\n")
+    return riwayat
+
+
+def _baca_saldo() -> Optional[int]:
+    """Membaca saldo dari `saldo.json`; None jika file tidak ada atau rusak."""
+    try:
+        with open(SALDO_FILE, "rb") as f:
+            isi = _loads(f.read())
+        # Format lama menyimpan `saldo` dalam rupiah (float)
+        return int(isi["saldo_sen"]) if "saldo_sen" in isi else ke_sen(isi["saldo"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _backup(path: str) -> None:
+    """Mengganti nama file rusak menjadi `.bak` tanpa menimpa backup sebelumnya."""
+    tujuan = path + ".bak"
+    nomor = 1
+    while os.path.exists(tujuan):
+        tujuan = f"{path}.bak{nomor}"
+        nomor += 1
+    try:
+        os.rename(path, tujuan)
+    except Exception:
+        pass
+
+
+def load_data() -> State:
+    """Membaca saldo dari `saldo.json` dan riwayat dari `data.jsonl`. Jika tidak ada, buat data awal."""
+    if not os.path.exists(RIWAYAT_FILE):
+        # Pindahkan data dari `data.json` lama jika ada
+        data_awal = _load_data_lama() or _data_awal()
         save_data(data_awal)
         return data_awal
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        riwayat = _baca_riwayat()
     except Exception:
-        # Jika file korup atau tidak bisa dibaca, backup dan buat data baru
-        try:
-            os.rename(DATA_FILE, DATA_FILE + ".bak")
-        except Exception:
-            pass
-        data_awal = {"saldo": 0, "riwayat": []}
+        # Jika file riwayat korup di tengah atau tidak bisa dibaca, backup dan buat data baru
+        _backup(RIWAYAT_FILE)
+        data_awal = _data_awal()
         save_data(data_awal)
         return data_awal
 
+    # Saldo hanyalah turunan dari riwayat: selalu dihitung ulang. `saldo.json` ditulis ulang
+    # jika isinya berbeda (hilang, rusak, atau program mati sebelum saldo sempat disimpan)
+    total_masuk, total_keluar = hitung_ringkasan(riwayat)
+    saldo = total_masuk - total_keluar
+    if _baca_saldo() != saldo:
+        save_saldo(saldo)
+    return State(saldo, riwayat)
+
+
+def _tulis_atomik(path: str, payload: bytes) -> None:
+    """Menulis file lewat file sementara lalu `os.replace`, agar tidak pernah setengah tertulis."""
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            # Pastikan isi benar-benar sampai ke disk sebelum rename; tanpa ini file bisa
+            # kosong setelah listrik padam
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # Jangan tinggalkan file sementara yang setengah tertulis
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def save_saldo(saldo: int) -> None:
+    """Menyimpan saldo (dalam sen) ke `saldo.json` (file kecil, cepat ditulis ulang)."""
+    _tulis_atomik(SALDO_FILE, _dumps({"saldo_sen": saldo}))
+
+
+def save_data(state: State) -> None:
+    """Menulis ulang seluruh data (riwayat + saldo). Dipakai saat membuat atau memindahkan data."""
+    global DIRTY
+    tutup_riwayat()
+    _antrian.clear()
+    DIRTY = False
+    # Serialisasi semua baris dulu, lalu tulis sekaligus dalam satu panggilan
+    baris = [_dumps(transaksi) + b"\n" for transaksi in state.riwayat.ke_dicts()]
+    _tulis_atomik(RIWAYAT_FILE, b"".join(baris))
+    save_saldo(state.saldo)
+
+
+def append_transaksi(state: State, transaksi: Transaksi) -> None:
+    """Menambahkan satu transaksi ke riwayat di memori; ditulis ke `data.jsonl` saat flush_data()."""
+    global DIRTY
+    state.riwayat.append(transaksi)
+    _antrian.append(_dumps(transaksi) + b"\n")
+    DIRTY = True
+    if len(_antrian) >= FLUSH_SETIAP:
+        flush_data(state)
 
-def save_data(data):
-    """Menyimpan data ke `data.json` secara rapi."""
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def flush_data(state: State) -> None:
+    """Menulis transaksi yang masih di memori ke akhir `data.jsonl` lalu menyimpan saldo."""
+    global _riwayat_file, DIRTY
+    if not DIRTY:
+        return
+    if _riwayat_file is None:
+        _riwayat_file = open(RIWAYAT_FILE, "ab")
+    _riwayat_file.write(b"".join(_antrian))
+    _riwayat_file.flush()
+    _antrian.clear()
+    save_saldo(state.saldo)
+    DIRTY = False
+
+
+def tutup_riwayat() -> None:
+    """Menutup file riwayat yang sedang terbuka (jika ada)."""
+    global _riwayat_file
+    if _riwayat_file is not None:
+        _riwayat_file.close()
+        _riwayat_file = None
 
 
 # ----- Fitur utama -----
 
-def tambah_pemasukan(data):
+def tambah_pemasukan(state: State) -> None:
     """Menambahkan pemasukan: minta jumlah dan keterangan, simpan ke riwayat."""
     print(FG_CYAN + BOLD + "\nTambah Pemasukan 💰" + RESET)
     try:
         jumlah_str = input("Masukkan jumlah pemasukan (angka): ").strip().replace('.', '').replace(',', '.')
-        jumlah = float(jumlah_str)
-    except ValueError:
+        jumlah = teks_ke_sen(jumlah_str)
+    except (ValueError, OverflowError):
         print(FG_RED + "Input tidak valid. Pastikan Anda memasukkan angka." + RESET)
         return
     if jumlah <= 0:
         print(FG_RED + "Jumlah harus lebih besar dari 0." + RESET)
         return
+    if state.saldo + jumlah > MAKS_SEN:
+        # Saldo baru tidak akan muat di int64
+        print(FG_YELLOW + "⚠️  Saldo akan melebihi batas maksimum. Transaksi dibatalkan." + RESET)
+        print("Saldo maksimum:", format_rupiah(MAKS_SEN))
+        return
     keterangan = input("Keterangan (misal: gaji, bonus): ").strip() or "(Tanpa keterangan)"
 
     # Tambahkan ke saldo dan riwayat
-    data["saldo"] = float(data.get("saldo", 0)) + jumlah
+    state.saldo += jumlah
     transaksi = {
-        "tanggal": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "tanggal": now_str(),
         "jenis": "Pemasukan",
-        "jumlah": jumlah,
+        "jumlah_sen": jumlah,
         "keterangan": keterangan,
     }
-    data["riwayat"].append(transaksi)
-    save_data(data)
+    append_transaksi(state, transaksi)
+    flush_data(state)  # simpan sebelum melapor berhasil
 
     print(FG_GREEN + "✅ Pemasukan berhasil ditambahkan! " + RESET + "🎉")
     print("- Jumlah:", format_rupiah(jumlah), "| Keterangan:", keterangan)
 
 
-def tambah_pengeluaran(data):
+def tambah_pengeluaran(state: State) -> None:
     """Menambahkan pengeluaran: minta jumlah dan keterangan, cek saldo, simpan jika cukup."""
     print(FG_CYAN + BOLD + "\nTambah Pengeluaran 🧾" + RESET)
     try:
         jumlah_str = input("Masukkan jumlah pengeluaran (angka): ").strip().replace('.', '').replace(',', '.')
-        jumlah = float(jumlah_str)
-    except ValueError:
+        jumlah = teks_ke_sen(jumlah_str)
+    except (ValueError, OverflowError):
         print(FG_RED + "Input tidak valid. Pastikan Anda memasukkan angka." + RESET)
         return
     if jumlah <= 0:
@@ -124,38 +455,38 @@ def tambah_pengeluaran(data):
         return
     keterangan = input("Keterangan (misal: makan, transport): ").strip() or "(Tanpa keterangan)"
 
-    saldo_sekarang = float(data.get("saldo", 0))
+    saldo_sekarang = state.saldo
     if jumlah > saldo_sekarang:
         print(FG_YELLOW + "⚠️  Saldo tidak mencukupi. Transaksi dibatalkan." + RESET)
         print("Saldo saat ini:", format_rupiah(saldo_sekarang))
         return
 
     # Kurangi saldo dan simpan transaksi
-    data["saldo"] = saldo_sekarang - jumlah
+    state.saldo -= jumlah
     transaksi = {
-        "tanggal": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "tanggal": now_str(),
         "jenis": "Pengeluaran",
-        "jumlah": jumlah,
+        "jumlah_sen": jumlah,
         "keterangan": keterangan,
     }
-    data["riwayat"].append(transaksi)
-    save_data(data)
+    append_transaksi(state, transaksi)
+    flush_data(state)  # simpan sebelum melapor berhasil
 
     print(FG_GREEN + "✅ Pengeluaran berhasil dicatat!" + RESET)
     print("- Jumlah:", format_rupiah(jumlah), "| Keterangan:", keterangan)
 
 
-def lihat_saldo(data):
+def lihat_saldo(state: State) -> None:
     """Menampilkan saldo beserta tabel transaksi (pemasukan & pengeluaran)."""
     clear_screen()
     print(FG_MAGENTA + BOLD + "= Laporan Saldo =" + RESET)
     print("-" * 80)
 
-    riwayat = data.get("riwayat", [])
+    riwayat = state.riwayat
 
     # Header tabel: Tanggal | Pemasukan | Pengeluaran | Keterangan
     headers = ["📅 Tanggal", "💸 Pemasukan", "💧 Pengeluaran", "📝 Keterangan"]
-    widths = [19, 18, 18, 29]
+    widths = [LEBAR_TANGGAL, LEBAR_JUMLAH, LEBAR_JUMLAH, LEBAR_KETERANGAN]
     header_line = f"{BOLD}{FG_CYAN}{headers[0]:<{widths[0]}}{headers[1]:>{widths[1]}}{headers[2]:>{widths[2]}}  {headers[3]:<{widths[3]}}{RESET}"
     print(header_line)
     print("-" * 80)
@@ -163,52 +494,61 @@ def lihat_saldo(data):
     if not riwayat:
         print(FG_YELLOW + "(Belum ada transaksi)" + RESET)
     else:
-        for it in riwayat:
-            tanggal = it.get("tanggal", "-")
-            jenis = it.get("jenis", "-")
-            jumlah = it.get("jumlah", 0)
-            ket = it.get("keterangan", "-")
-
-            # Potong keterangan agar tidak pecah tabel
-            if len(ket) > widths[3]:
-                ket = ket[: widths[3] - 3] + "..."
-
-            # Siapkan teks tanpa warna dengan padding agar alignment konsisten
-            if jenis.lower().startswith("pemasukan"):
-                pemasukan_plain = format_rupiah(jumlah)
-                pengeluaran_plain = ""
-            else:
-                pemasukan_plain = ""
-                pengeluaran_plain = "-" + format_rupiah(jumlah)
-
-            pemasukan_cell = f"{pemasukan_plain:>{widths[1]}}"
-            pengeluaran_cell = f"{pengeluaran_plain:>{widths[2]}}"
-
-            # Balut dengan warna jika ada nilai
-            if pemasukan_plain:
-                pemasukan_cell = FG_GREEN + pemasukan_cell + RESET
-            if pengeluaran_plain:
-                pengeluaran_cell = FG_RED + pengeluaran_cell + RESET
-
-            print(f"{tanggal:<{widths[0]}}{pemasukan_cell}{pengeluaran_cell}  {ket:<{widths[3]}}")
+        # Kumpulkan semua baris lalu tulis sekaligus (satu write, bukan satu print per baris)
+        sys.stdout.write(render_saldo_rows(riwayat, *widths))
+        sys.stdout.write("\n")
 
     print("-" * 80)
 
     # Tampilkan jumlah saldo di bawah tabel
-    saldo_sekarang = data.get("saldo", 0)
+    saldo_sekarang = state.saldo
     print("\n" + FG_MAGENTA + BOLD + "Jumlah Saldo:" + RESET + " "+ FG_GREEN + BOLD + f"{format_rupiah(saldo_sekarang)} 💵" + RESET)
     print("\n")
 
 
-def lihat_riwayat(data):
+def _render_baris(riwayat: Riwayat, templates: List[str], awalan: Tuple[str, str], lebar_ket: int) -> str:
+    """Mengisi template baris (satu per kode jenis) untuk setiap transaksi, lalu menggabungkannya.
+
+    `awalan[jenis]` ditempelkan di depan jumlah (misal "-" untuk pengeluaran).
+    """
+    lines: List[str] = []
+    append = lines.append
+    _fmt = format_rupiah
+    for tanggal, jenis, jumlah, ket in zip(riwayat.tanggal, riwayat.jenis, riwayat.jumlah, riwayat.keterangan):
+        # Potong keterangan agar tidak pecah tabel
+        if len(ket) > lebar_ket:
+            ket = ket[: lebar_ket - 3] + "..."
+        append(templates[jenis].format(tanggal, awalan[jenis] + _fmt(jumlah), ket))
+    return "\n".join(lines)
+
+
+def render_saldo_rows(riwayat: Riwayat, w0: int, w1: int, w2: int, w3: int) -> str:
+    """Merangkai baris-baris tabel laporan saldo (kolom pemasukan & pengeluaran terpisah)."""
+    # Template per jenis: warna dan kolom yang kosong sudah terpasang, tinggal diisi
+    templates = ["", ""]
+    templates[PEMASUKAN] = f"{{:<{w0}}}{FG_GREEN}{{:>{w1}}}{RESET}{'':>{w2}}  {{:<{w3}}}"
+    templates[PENGELUARAN] = f"{{:<{w0}}}{'':>{w1}}{FG_RED}{{:>{w2}}}{RESET}  {{:<{w3}}}"
+    return _render_baris(riwayat, templates, ("", "-"), w3)
+
+
+def render_rows(riwayat: Riwayat, w0: int, w1: int, w2: int, w3: int) -> str:
+    """Merangkai baris-baris tabel riwayat menjadi satu string (tanpa mencetak)."""
+    # Satu template per jenis (indeks = kode jenis); nama jenis dan warna sudah terpasang
+    templates = ["", ""]
+    templates[PEMASUKAN] = f"{{:<{w0}}}{NAMA_JENIS[PEMASUKAN]:<{w1}}{FG_GREEN}{{:>{w2}}}{RESET}  {{:<{w3}}}"
+    templates[PENGELUARAN] = f"{{:<{w0}}}{NAMA_JENIS[PENGELUARAN]:<{w1}}{FG_RED}{{:>{w2}}}{RESET}  {{:<{w3}}}"
+    return _render_baris(riwayat, templates, ("", ""), w3)
+
+
+def lihat_riwayat(state: State) -> None:
     """Menampilkan riwayat transaksi dalam bentuk tabel dengan warna dan emoji."""
-    riwayat = data.get("riwayat", [])
+    riwayat = state.riwayat
     print(FG_BLUE + BOLD + "\n📋 Riwayat Transaksi" + RESET)
     print("-" * 80)
 
     # Header tabel
     headers = ["📅 Tanggal", "🔁 Jenis", "💰 Jumlah", "📝 Keterangan"]
-    widths = [19, 12, 18, 29]  # lebar kolom
+    widths = [LEBAR_TANGGAL, LEBAR_JENIS, LEBAR_JUMLAH, LEBAR_KETERANGAN]  # lebar kolom
     header_line = (
         f"{BOLD}{FG_CYAN}{headers[0]:<{widths[0]}}{headers[1]:<{widths[1]}}{headers[2]:>{widths[2]}}  {headers[3]:<{widths[3]}}{RESET}"
     )
@@ -219,26 +559,41 @@ def lihat_riwayat(data):
         print(FG_YELLOW + "(Belum ada transaksi)" + RESET)
         return
 
-    # Tampilkan baris-baris riwayat
-    for it in riwayat:
-        tanggal = it.get("tanggal", "-")
-        jenis = it.get("jenis", "-")
-        jumlah = it.get("jumlah", 0)
-        ket = it.get("keterangan", "-")
-        jumlah_str = format_rupiah(jumlah)
-        # Potong keterangan agar tidak pecah tabel
-        if len(ket) > widths[3]:
-            ket = ket[: widths[3] - 3] + "..."
-        # Warna berdasarkan jenis
-        warna = FG_GREEN if jenis.lower().startswith("pemasukan") else FG_RED
-        print(f"{tanggal:<{widths[0]}}{jenis:<{widths[1]}}{warna}{jumlah_str:>{widths[2]}}{RESET}  {ket:<{widths[3]}}")
+    # Tampilkan baris-baris riwayat (dirangkai dulu, lalu ditulis sekaligus)
+    sys.stdout.write(render_rows(riwayat, *widths))
+    sys.stdout.write("\n")
 
     print("-" * 80)
 
 
+def hitung_ringkasan(riwayat: Riwayat) -> Tuple[int, int]:
+    """Menghitung total pemasukan dan pengeluaran dalam satu kali jalan."""
+    total_masuk = 0
+    total_keluar = 0
+    for jenis, jumlah in zip(riwayat.jenis, riwayat.jumlah):
+        if jenis == PEMASUKAN:
+            total_masuk += jumlah
+        else:
+            total_keluar += jumlah
+    return total_masuk, total_keluar
+
+
+def lihat_ringkasan(state: State) -> None:
+    """Menampilkan ringkasan: total pemasukan, total pengeluaran, dan selisihnya."""
+    riwayat = state.riwayat
+    total_masuk, total_keluar = hitung_ringkasan(riwayat)
+    print(FG_BLUE + BOLD + "\n📊 Ringkasan Keuangan" + RESET)
+    print("-" * 40)
+    print(f"{'Jumlah transaksi':<20}{len(riwayat):>20}")
+    print(f"{'Total pemasukan':<20}" + FG_GREEN + f"{format_rupiah(total_masuk):>20}" + RESET)
+    print(f"{'Total pengeluaran':<20}" + FG_RED + f"{format_rupiah(total_keluar):>20}" + RESET)
+    print("-" * 40)
+    print(BOLD + f"{'Selisih':<20}{format_rupiah(total_masuk - total_keluar):>20}" + RESET)
+
+
 # ----- Menu utama -----
 
-def tampilkan_menu():
+def tampilkan_menu() -> None:
     """Menampilkan menu utama dalam bentuk table sederhana."""
     clear_screen()
     print(BOLD + FG_MAGENTA + "\n✨ APLIKASI PENGELOLA UANG SEDERHANA ✨" + RESET)
@@ -248,34 +603,57 @@ def tampilkan_menu():
     print(FG_BLUE + "2.)" + RESET + " ➖ Tambah Pengeluaran")
     print(FG_BLUE + "3.)" + RESET + " 💳 Lihat Saldo")
     print(FG_BLUE + "4.)" + RESET + " 📋 Lihat Riwayat Transaksi")
-    print(FG_BLUE + "5.)" + RESET + " ❌ Keluar" + "\n")
+    print(FG_BLUE + "5.)" + RESET + " 📊 Ringkasan")
+    print(FG_BLUE + "6.)" + RESET + " ❌ Keluar" + "\n")
 
 
-def main():
+def main() -> None:
     """Loop utama program."""
-    data = load_data()
+    state = load_data()
+    # Simpan transaksi yang belum ditulis saat program selesai (menu Keluar, Ctrl+C, dll.).
+    # atexit berjalan terbalik: flush_data dulu, baru tutup_riwayat.
+    atexit.register(tutup_riwayat)
+    atexit.register(flush_data, state)
+    # SIGTERM (kill) dan SIGHUP (terminal ditutup) tidak menjalankan atexit; ubah jadi sys.exit
+    for nama in ("SIGTERM", "SIGHUP"):
+        sinyal = getattr(signal, nama, None)  # SIGHUP tidak ada di Windows
+        if sinyal is not None:
+            signal.signal(sinyal, lambda *_: sys.exit(0))
 
+    try:
+        menu_loop(state)
+    except KeyboardInterrupt:
+        # Simpan dulu, baru katakan data sudah disimpan
+        flush_data(state)
+        print("\n\n" + FG_GREEN + "Keluar. Data telah disimpan. Sampai jumpa! 👋" + RESET)
+        sys.exit(0)
+
+
+def menu_loop(state: State) -> None:
+    """Menampilkan menu dan menjalankan pilihan pengguna sampai keluar."""
     while True:
         tampilkan_menu()
         pilihan = input("Masukkan pilihan: ").strip()
         if pilihan == "1":
-            tambah_pemasukan(data)
+            tambah_pemasukan(state)
             input("\nTekan Enter untuk kembali ke menu...")
         elif pilihan == "2":
-            tambah_pengeluaran(data)
+            tambah_pengeluaran(state)
             input("\nTekan Enter untuk kembali ke menu...")
         elif pilihan == "3":
-            lihat_saldo(data)
+            lihat_saldo(state)
             input("\nTekan Enter untuk kembali ke menu...")
         elif pilihan == "4":
-            lihat_riwayat(data)
+            lihat_riwayat(state)
             input("\nTekan Enter untuk kembali ke menu...")
         elif pilihan == "5":
+            lihat_ringkasan(state)
+            input("\nTekan Enter untuk kembali ke menu...")
+        elif pilihan == "6":
             print(FG_GREEN + "\nTerima kasih! Sampai jumpa 👋" + RESET)
-            save_data(data)
             sys.exit(0)
         else:
-            print(FG_YELLOW + "Pilihan tidak dikenali. Silakan pilih 1-5." + RESET)
+            print(FG_YELLOW + "Pilihan tidak dikenali. Silakan pilih 1-6." + RESET)
             input("Tekan Enter untuk kembali ke menu...")
 
 
@@ -283,11 +661,6 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print("\n\n" + FG_GREEN + "Keluar. Data telah disimpan. Sampai jumpa! 👋" + RESET)
-        # Pastikan data tersimpan
-        # (data kemungkinan belum terdefinisi jika keluar sebelum load)
-        try:
-            save_data(load_data())
-        except Exception:
-            pass
+        # Ctrl+C sebelum menu tampil (misalnya saat memuat data); belum ada yang perlu disimpan
+        print("\n\n" + FG_GREEN + "Keluar. Sampai jumpa! 👋" + RESET)
         sys.exit(0)